@@ -57,19 +57,19 @@ def circuit_breaker(service_name):
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            current_time = time.time()
+            current_time = time.monotonic()
             
             # Check if circuit is open
             if service_name in circuit_breaker_state:
                 last_failure_time, failure_count = circuit_breaker_state[service_name]
                 if failure_count >= CIRCUIT_BREAKER_THRESHOLD:
                     if current_time - last_failure_time < CIRCUIT_BREAKER_TIMEOUT:
-                        app.logger.warning(f"Circuit breaker open for {service_name}")
+                        app.logger.warning("Circuit breaker open for %s", service_name)
                         return jsonify({"error": get_error_message("server_unavailable")}), 503
                     else:
                         # Reset circuit breaker after timeout
                         del circuit_breaker_state[service_name]
-                        app.logger.info(f"Circuit breaker reset for {service_name}")
+                        app.logger.info("Circuit breaker reset for %s", service_name)
             
             try:
                 result = f(*args, **kwargs)
@@ -84,7 +84,7 @@ def circuit_breaker(service_name):
                 # Update circuit breaker state
                 if error_counts[service_name] >= CIRCUIT_BREAKER_THRESHOLD:
                     circuit_breaker_state[service_name] = (current_time, error_counts[service_name])
-                    app.logger.error(f"Circuit breaker triggered for {service_name}")
+                    app.logger.error("Circuit breaker triggered for %s", service_name)
                 
                 raise e
         return decorated_function
@@ -109,10 +109,10 @@ def retry_on_failure(max_attempts=MAX_RETRY_ATTEMPTS, delay=RETRY_DELAY):
                 except Exception as e:
                     last_exception = e
                     if attempt < max_attempts - 1:
-                        app.logger.warning(f"Attempt {attempt + 1} failed for {f.__name__}: {str(e)}. Retrying...")
+                        app.logger.warning("Attempt %d failed for %s: %s. Retrying...", attempt + 1, f.__name__, e)
                         time.sleep(delay * (attempt + 1))  # Exponential backoff
                     else:
-                        app.logger.error(f"All {max_attempts} attempts failed for {f.__name__}: {str(e)}")
+                        app.logger.error("All %d attempts failed for %s: %s", max_attempts, f.__name__, e)
             
             raise last_exception
         return decorated_function
@@ -129,7 +129,7 @@ def handle_api_error(error, operation_name):
     Returns:
         Tuple of (JSON response, HTTP status code)
     """
-    app.logger.error(f"API error in {operation_name}: {str(error)}")
+    app.logger.error("API error in %s: %s", operation_name, error)
     
     if isinstance(error, FileNotFoundError):
         return jsonify({"error": get_error_message("file_not_found")}), 404
@@ -147,13 +147,14 @@ try:
     data_processor = CSVDataProcessor()
     app.logger.info("CSV data processor initialized successfully")
 except Exception as e:
-    app.logger.error(f"Failed to initialize data processor: {str(e)}")
+    app.logger.error("Failed to initialize data processor: %s", e)
     # Create dummy processor to prevent app crash
     data_processor = None
 
 # Performance optimization: Simple in-memory cache
 _response_cache = {}
 _cache_timeout = 300  # 5 minutes cache timeout
+_cache_next_sweep = 0.0  # Earliest time any cached entry can have expired
 
 def cache_response(timeout=300):
     """
@@ -165,9 +166,11 @@ def cache_response(timeout=300):
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
+            global _response_cache, _cache_next_sweep
+            
             # Create cache key from function name and arguments
             cache_key = f"{f.__name__}:{str(args)}:{str(sorted(kwargs.items()))}"
-            current_time = time.time()
+            current_time = time.monotonic()
             
             # Check if we have a valid cached response
             if cache_key in _response_cache:
@@ -181,12 +184,14 @@ def cache_response(timeout=300):
             # Cache the response
             _response_cache[cache_key] = (result, current_time)
             
-            # Clean old cache entries (simple cleanup)
-            if len(_response_cache) > 100:  # Limit cache size
-                old_keys = [k for k, (_, ts) in _response_cache.items() 
-                           if current_time - ts > timeout]
-                for key in old_keys:
-                    _response_cache.pop(key, None)
+            # Clean old cache entries once the cache is large and the oldest
+            # entry can actually have expired
+            if len(_response_cache) > 100 and current_time >= _cache_next_sweep:
+                # Rebuild with only the fresh entries in a single pass
+                cutoff = current_time - timeout
+                _response_cache = {k: entry for k, entry in _response_cache.items()
+                                   if entry[1] >= cutoff}
+                _cache_next_sweep = min(ts for _, ts in _response_cache.values()) + timeout
             
             return result
         return decorated_function
@@ -202,12 +207,12 @@ def index():
     """Main application page with song selector interface and Spanish translations."""
     try:
         # Pass Spanish translations to the template
-        translations = SPANISH_TRANSLATIONS
+        translations = dict(SPANISH_TRANSLATIONS)
         # Ensure consistent page title
         translations['page_title'] = translations['app_title']
         return render_template('index.html', translations=translations)
     except Exception as e:
-        app.logger.error(f"Error rendering index page: {str(e)}")
+        app.logger.error("Error rendering index page: %s", e)
         return get_error_message("500"), 500
 
 @app.route('/api/songs')
@@ -236,7 +241,7 @@ def get_songs():
         # Ensure all songs have order information and handle missing order values gracefully
         for song in songs:
             if 'order' not in song or song['order'] is None:
-                app.logger.warning(f"Song {song.get('song_id', 'unknown')} missing order information")
+                app.logger.warning("Song %s missing order information", song.get('song_id', 'unknown'))
                 # Assign a high order number for songs without order
                 song['order'] = 9999
         
@@ -399,12 +404,12 @@ def global_selector():
     """Global song selection interface with Spanish language support."""
     try:
         # Pass Spanish translations to the template
-        translations = SPANISH_TRANSLATIONS
+        translations = dict(SPANISH_TRANSLATIONS)
         # Ensure consistent page title
         translations['page_title'] = translations['global_selector_title']
         return render_template('global-selector.html', translations=translations)
     except Exception as e:
-        app.logger.error(f"Error rendering global selector page: {str(e)}")
+        app.logger.error("Error rendering global selector page: %s", e)
         return get_error_message("500"), 500
 
 @app.route('/api/health')
@@ -451,7 +456,7 @@ def get_system_health():
         return jsonify(health_status)
         
     except Exception as e:
-        app.logger.error(f"Error getting system health: {str(e)}")
+        app.logger.error("Error getting system health: %s", e)
         return jsonify({
             "status": "unhealthy",
             "error": str(e),
@@ -7,6 +7,8 @@ for frontend consumption with comprehensive error handling and retry mechanisms.
 """
 
 import csv
+import hashlib
+import os
 import re
 import time
 import logging
@@ -36,11 +38,11 @@ def retry_on_failure(max_attempts=3, delay=1.0, backoff_factor=2.0):
                 except Exception as e:
                     last_exception = e
                     if attempt < max_attempts - 1:
-                        logging.warning(f"Attempt {attempt + 1} failed for {func.__name__}: {str(e)}. Retrying in {current_delay}s...")
+                        logging.warning("Attempt %d failed for %s: %s. Retrying in %ss...", attempt + 1, func.__name__, e, current_delay)
                         time.sleep(current_delay)
                         current_delay *= backoff_factor
                     else:
-                        logging.error(f"All {max_attempts} attempts failed for {func.__name__}: {str(e)}")
+                        logging.error("All %d attempts failed for %s: %s", max_attempts, func.__name__, e)
             
             raise last_exception
         return wrapper
@@ -91,6 +93,7 @@ class CSVDataProcessor:
         self._songs_by_id: Dict[str, OrderedSong] = {}
         self._songs_by_order: Dict[int, OrderedSong] = {}
         self._dropdown_cache: List[Dict] = []
+        self._consistency_report: Optional[Dict] = None
         self._data_loaded = False
         self._last_modified_time = None
         self._cache_timestamp = None
@@ -112,7 +115,6 @@ class CSVDataProcessor:
         Returns:
             Hash string representing the data
         """
-        import hashlib
         data_str = str(sorted([(s.song_id, s.artist, s.song, s.order) for s in data]))
         return hashlib.md5(data_str.encode()).hexdigest()
     
@@ -232,10 +234,10 @@ class CSVDataProcessor:
             operation: Description of the operation that failed
         """
         self._error_count += 1
-        self.logger.error(f"Data error in {operation}: {str(error)}")
+        self.logger.error("Data error in %s: %s", operation, error)
         
         if self._error_count >= self._max_error_threshold:
-            self.logger.critical(f"Error threshold exceeded ({self._max_error_threshold}). Activating fallback mode.")
+            self.logger.critical("Error threshold exceeded (%d). Activating fallback mode.", self._max_error_threshold)
             if not self._fallback_data:
                 self._fallback_data = self._create_fallback_data()
     
@@ -259,7 +261,6 @@ class CSVDataProcessor:
             True if cache is valid, False if needs refresh
         """
         try:
-            import os
             current_mtime = os.path.getmtime(self.csv_file_path)
             return (self._last_modified_time is not None and 
                     current_mtime == self._last_modified_time and
@@ -270,7 +271,6 @@ class CSVDataProcessor:
     def _update_cache_timestamp(self):
         """Update the cache timestamp and file modification time."""
         try:
-            import os
             self._last_modified_time = os.path.getmtime(self.csv_file_path)
             self._cache_timestamp = time.time()
         except (OSError, FileNotFoundError):
@@ -331,9 +331,10 @@ class CSVDataProcessor:
         Returns:
             Cleaned assignment string or None if empty/invalid
         """
-        if assignment is None or assignment == "" or str(assignment).strip() == "":
+        if assignment is None:
             return None
-        return str(assignment).strip()
+        cleaned = str(assignment).strip()
+        return cleaned or None
     
     def _parse_order_value(self, order_value: str, default_order: int) -> int:
         """
@@ -346,17 +347,20 @@ class CSVDataProcessor:
         Returns:
             Valid integer order value
         """
-        if order_value is None or str(order_value).strip() == "":
+        if order_value is None:
+            return default_order
+        order_text = str(order_value).strip()
+        if not order_text:
             return default_order
         
         try:
-            parsed_order = int(float(str(order_value).strip()))
+            parsed_order = int(float(order_text))
             if parsed_order <= 0:
-                self.logger.warning(f"Invalid order value {parsed_order}, using default {default_order}")
+                self.logger.warning("Invalid order value %d, using default %d", parsed_order, default_order)
                 return default_order
             return parsed_order
         except (ValueError, TypeError):
-            self.logger.warning(f"Could not parse order value '{order_value}', using default {default_order}")
+            self.logger.warning("Could not parse order value '%s', using default %d", order_value, default_order)
             return default_order
     
     @retry_on_failure(max_attempts=3, delay=0.5)
@@ -383,6 +387,7 @@ class CSVDataProcessor:
             self._songs_by_id.clear()
             self._songs_by_order.clear()
             self._dropdown_cache.clear()
+            self._consistency_report = None
             
             # Load CSV data using built-in csv module with enhanced error handling
             with open(self.csv_file_path, 'r', encoding='utf-8') as csvfile:
@@ -422,7 +427,7 @@ class CSVDataProcessor:
                     try:
                         # Validate required fields
                         if not row.get('Artist') or not row.get('Song'):
-                            self.logger.warning(f"Row {row_num}: Missing artist or song title, skipping")
+                            self.logger.warning("Row %d: Missing artist or song title, skipping", row_num)
                             continue
                         
                         # Generate unique song ID
@@ -450,7 +455,7 @@ class CSVDataProcessor:
                         processed_songs.append(song)
                         
                     except Exception as e:
-                        self.logger.warning(f"Row {row_num}: Error processing row: {str(e)}, skipping")
+                        self.logger.warning("Row %d: Error processing row: %s, skipping", row_num, e)
                         continue
                 
                 if not processed_songs:
@@ -462,7 +467,7 @@ class CSVDataProcessor:
                 # Validate data integrity
                 is_valid, issues = self._validate_data_integrity(processed_songs)
                 if not is_valid:
-                    self.logger.warning(f"Data integrity issues found: {issues}")
+                    self.logger.warning("Data integrity issues found: %s", issues)
                     # Continue with data but log issues
                 
                 # Store processed data
@@ -484,7 +489,7 @@ class CSVDataProcessor:
                 self._update_cache_timestamp()
                 self._error_count = 0  # Reset error count on successful load
                 
-                self.logger.info(f"Successfully loaded {len(processed_songs)} songs from CSV")
+                self.logger.info("Successfully loaded %d songs from CSV", len(processed_songs))
                 return self._songs_cache.copy()
                 
         except FileNotFoundError as e:
@@ -611,17 +616,11 @@ class CSVDataProcessor:
         if not current_song:
             return None
         
-        # Find the next song by order
-        sorted_songs = sorted(self._songs_cache, key=lambda s: s.order)
-        
-        for i, song in enumerate(sorted_songs):
-            if song.song_id == current_song_id:
-                # Return next song if it exists
-                if i + 1 < len(sorted_songs):
-                    return sorted_songs[i + 1]
-                break
+        # Relationships are built once per load by _build_song_relationships
+        if current_song.next_song_id is None:
+            return None
         
-        return None
+        return self._songs_by_id.get(current_song.next_song_id)
     
     def get_previous_song(self, current_song_id: str) -> Optional[OrderedSong]:
         """
@@ -640,17 +639,11 @@ class CSVDataProcessor:
         if not current_song:
             return None
         
-        # Find the previous song by order
-        sorted_songs = sorted(self._songs_cache, key=lambda s: s.order)
-        
-        for i, song in enumerate(sorted_songs):
-            if song.song_id == current_song_id:
-                # Return previous song if it exists
-                if i > 0:
-                    return sorted_songs[i - 1]
-                break
+        # Relationships are built once per load by _build_song_relationships
+        if current_song.previous_song_id is None:
+            return None
         
-        return None
+        return self._songs_by_id.get(current_song.previous_song_id)
     
     def _build_song_relationships(self):
         """
@@ -881,12 +874,27 @@ class CSVDataProcessor:
         """
         Perform comprehensive data consistency validation.
         
+        The report only depends on the loaded songs, so it is computed once
+        per load and reused by the health endpoint on every poll.
+        
         Returns:
             Dictionary containing validation results
         """
         if not self._data_loaded:
             self.load_songs()
         
+        if self._consistency_report is None:
+            self._consistency_report = self._build_consistency_report()
+        
+        return self._consistency_report.copy()
+    
+    def _build_consistency_report(self) -> Dict:
+        """
+        Run the full consistency checks over the current song cache.
+        
+        Returns:
+            Dictionary containing validation results
+        """
         is_valid, issues = self._validate_data_integrity(self._songs_cache)
         
         # Additional consistency checks
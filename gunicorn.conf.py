@@ -7,15 +7,23 @@ import os
 import multiprocessing
 
 # Server socket
-bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+bind = [f"0.0.0.0:{os.environ.get('PORT', '8000')}"]
+# Also listen on a UNIX socket when a reverse proxy runs on the same host,
+# e.g. nginx with "upstream app { server unix:/var/run/app.sock; }"
+if os.environ.get('UNIX_SOCK_PATH'):
+    bind.append(f"unix:{os.environ['UNIX_SOCK_PATH']}")
 backlog = 2048
 
 # Worker processes
-workers = multiprocessing.cpu_count() * 2 + 1
+# Count only the CPUs this process may run on; in a container with a cpuset
+# cpu_count() still reports every core on the host
+try:
+    cpu_count = len(os.sched_getaffinity(0))
+except AttributeError:
+    cpu_count = multiprocessing.cpu_count()
+workers = cpu_count * 2 + 1
 worker_class = "sync"  # Standard synchronous workers
 worker_connections = 1000
-max_requests = 1000
-max_requests_jitter = 50
 preload_app = True
 timeout = 120
 keepalive = 2
@@ -3,6 +3,36 @@ Spanish Translation System for Rock and Roll Forum Jam en Español
 Provides comprehensive Spanish translations for all UI elements.
 """
 
+import functools
+import re
+import types
+
+__all__ = [
+    "SPANISH_TRANSLATIONS",
+    "get_translation",
+    "translate",
+    "get_message",
+    "get_messages",
+    "translate_instrument_name",
+    "get_error_message",
+    "get_retry_message",
+    "get_recovery_message",
+    "format_duration_spanish",
+    "format_order_display",
+    "get_next_song_message",
+    "get_connection_status_message",
+    "get_global_selector_message",
+    "get_order_error_message",
+    "get_global_error_message",
+    "get_websocket_error_message",
+    "get_session_sync_error_message",
+    "get_network_retry_message",
+    "get_conflict_resolution_message",
+    "get_recovery_status_message",
+    "get_degraded_mode_message",
+    "get_realtime_notification_message",
+]
+
 # Spanish translation dictionary for all UI elements
 SPANISH_TRANSLATIONS = {
     # Application branding
@@ -405,18 +435,79 @@ SPANISH_TRANSLATIONS = {
     "realtime_normal_mode_notification": "Sincronización en tiempo real normal restaurada"
 }
 
-def get_translation(key, default=None):
+# Translations are shared across requests, so expose them as a read-only view
+SPANISH_TRANSLATIONS = types.MappingProxyType(SPANISH_TRANSLATIONS)
+
+# Specific instrument mappings used by translate_instrument_name
+_INSTRUMENT_MAPPINGS = {
+    "lead guitar": "Guitarra Principal",
+    "rhythm guitar": "Guitarra Rítmica", 
+    "bass": "Bajo",
+    "battery": "Batería",
+    "drums": "Batería",
+    "singer": "Voz",
+    "lead singer": "Voz",
+    "vocals": "Voz",
+    "keyboards": "Teclados",
+    "keyboard": "Teclado",
+    "piano": "Piano"
+}
+
+# Keywords used for partial instrument matches, mapped to their category
+# (guitar qualifiers are scanned in the same pass)
+_INSTRUMENT_KEYWORDS = {
+    "electric": "electric",
+    "acoustic": "acoustic",
+    "lead": "lead",
+    "rhythm": "rhythm",
+    "rythm": "rhythm",  # Handle typo in CSV
+    "guitar": "guitar",
+    "bass": "bass",
+    "drum": "drums",
+    "battery": "drums",
+    "vocal": "voice",
+    "voice": "voice",
+    "singing": "voice",
+    "singer": "voice",
+    "keyboard": "keys",
+    "keys": "keys",
+    "piano": "piano"
+}
+
+# Single-pass scanner over all keywords (lookahead so overlapping matches are found)
+_INSTRUMENT_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(map(re.escape, _INSTRUMENT_KEYWORDS)) + "))"
+)
+
+def _make_get_translation(translations=SPANISH_TRANSLATIONS):
     """
-    Get Spanish translation for a given key.
+    Build get_translation with the bound lookup method held in a closure.
     
     Args:
-        key (str): Translation key
-        default (str, optional): Default value if key not found
+        translations (Mapping): Translation mapping to read from
         
     Returns:
-        str: Spanish translation or default value
+        callable: get_translation function
     """
-    return SPANISH_TRANSLATIONS.get(key, default or key)
+    lookup = translations.get
+    
+    def get_translation(key, default=None):
+        """
+        Get Spanish translation for a given key.
+        
+        Args:
+            key (str): Translation key
+            default (str, optional): Default value if key not found
+            
+        Returns:
+            str: Spanish translation or default value
+        """
+        # Missing keys and empty translations both fall back to default, then key
+        return lookup(key) or default or key
+    
+    return get_translation
+
+get_translation = _make_get_translation()
 
 def translate_instrument_name(instrument_name):
     """
@@ -428,59 +519,142 @@ def translate_instrument_name(instrument_name):
     Returns:
         str: Spanish instrument name or original if no translation found
     """
-    # Convert to lowercase for lookup
-    key = instrument_name.lower().strip()
+    # Normalize once so the cache keys on the lookup form
+    translated = _translate_instrument_key(instrument_name.strip().casefold())
+    
+    # Return original if no translation found
+    return translated or instrument_name
+
+@functools.lru_cache(maxsize=256)
+def _translate_instrument_key(key):
+    """
+    Translate a normalized (stripped, casefolded) instrument name to Spanish.
     
+    Args:
+        key (str): Normalized instrument name
+        
+    Returns:
+        str: Spanish instrument name, or None if no translation found
+    """
     # Check for direct translation
     if key in SPANISH_TRANSLATIONS:
         return SPANISH_TRANSLATIONS[key]
     
-    # Check for specific instrument mappings
-    instrument_mappings = {
-        "lead guitar": "Guitarra Principal",
-        "rhythm guitar": "Guitarra Rítmica", 
-        "bass": "Bajo",
-        "battery": "Batería",
-        "drums": "Batería",
-        "singer": "Voz",
-        "lead singer": "Voz",
-        "vocals": "Voz",
-        "keyboards": "Teclados",
-        "keyboard": "Teclado",
-        "piano": "Piano"
-    }
-    
     # Check for exact matches first
-    if key in instrument_mappings:
-        return instrument_mappings[key]
+    if key in _INSTRUMENT_MAPPINGS:
+        return _INSTRUMENT_MAPPINGS[key]
     
     # Check for partial matches (e.g., "Electric Guitar" -> "Guitarra Eléctrica")
-    if "guitar" in key:
-        if "electric" in key:
+    categories = {_INSTRUMENT_KEYWORDS[keyword] for keyword in _INSTRUMENT_KEYWORD_PATTERN.findall(key)}
+    
+    if "guitar" in categories:
+        if "electric" in categories:
             return "Guitarra Eléctrica"
-        elif "acoustic" in key:
+        elif "acoustic" in categories:
             return "Guitarra Acústica"
-        elif "bass" in key:
+        elif "bass" in categories:
             return "Guitarra Bajo"
-        elif "lead" in key:
+        elif "lead" in categories:
             return "Guitarra Principal"
-        elif "rhythm" in key or "rythm" in key:  # Handle typo in CSV
+        elif "rhythm" in categories:
             return "Guitarra Rítmica"
         else:
             return "Guitarra"
-    elif "bass" in key and "guitar" not in key:
+    elif "bass" in categories:
         return "Bajo"
-    elif "drum" in key or "battery" in key:
+    elif "drums" in categories:
         return "Batería"
-    elif "vocal" in key or "voice" in key or "singing" in key or "singer" in key:
+    elif "voice" in categories:
         return "Voz"
-    elif "keyboard" in key or "keys" in key:
+    elif "keys" in categories:
         return "Teclados"
-    elif "piano" in key:
+    elif "piano" in categories:
         return "Piano"
     
-    # Return original if no translation found
-    return instrument_name
+    return None
+
+# Localized error messages keyed by error type
+_ERROR_MESSAGES = {
+    "404": get_translation("not_found"),
+    "500": get_translation("server_error"),
+    "connection": get_translation("connection_error"),
+    "data": get_translation("data_error"),
+    "song_not_found": get_translation("song_not_found"),
+    "musician_not_found": get_translation("musician_not_found"),
+    "file_not_found": get_translation("data_file_not_found"),
+    "invalid_format": get_translation("invalid_data_format"),
+    "load_songs": get_translation("failed_to_load_songs"),
+    "load_musicians": get_translation("failed_to_load_musicians"),
+    "load_song_details": get_translation("failed_to_load_song_details"),
+    "load_musician_details": get_translation("failed_to_load_musician_details"),
+    "not_initialized": get_translation("application_not_initialized"),
+    
+    # Enhanced error types
+    "network": get_translation("network_error"),
+    "timeout": get_translation("timeout_error"),
+    "server_unavailable": get_translation("server_unavailable"),
+    "api_error": get_translation("api_error"),
+    "request_failed": get_translation("request_failed"),
+    "invalid_response": get_translation("invalid_response"),
+    "data_corruption": get_translation("data_corruption"),
+    "cache_error": get_translation("cache_error"),
+    "session_expired": get_translation("session_expired"),
+    "permission_denied": get_translation("permission_denied"),
+    "data_inconsistency": get_translation("data_inconsistency"),
+    "sync_error": get_translation("sync_error"),
+    "validation_failed": get_translation("validation_failed"),
+    "integrity_check_failed": get_translation("integrity_check_failed"),
+    "missing_required_data": get_translation("missing_required_data"),
+    "duplicate_data": get_translation("duplicate_data"),
+    
+    # WebSocket error types
+    "websocket_connection_failed": get_translation("websocket_connection_failed"),
+    "websocket_upgrade_failed": get_translation("websocket_upgrade_failed"),
+    "websocket_handshake_failed": get_translation("websocket_handshake_failed"),
+    "websocket_protocol_error": get_translation("websocket_protocol_error"),
+    "websocket_security_error": get_translation("websocket_security_error"),
+    "websocket_network_error": get_translation("websocket_network_error"),
+    "websocket_server_error": get_translation("websocket_server_error"),
+    "websocket_client_error": get_translation("websocket_client_error"),
+    "websocket_transport_error": get_translation("websocket_transport_error"),
+    "websocket_authentication_failed": get_translation("websocket_authentication_failed"),
+    "websocket_authorization_failed": get_translation("websocket_authorization_failed"),
+    "websocket_rate_limit_exceeded": get_translation("websocket_rate_limit_exceeded"),
+    "websocket_quota_exceeded": get_translation("websocket_quota_exceeded"),
+    "websocket_service_overloaded": get_translation("websocket_service_overloaded"),
+    "websocket_maintenance_mode": get_translation("websocket_maintenance_mode"),
+    
+    # Session synchronization error types
+    "session_sync_failed": get_translation("session_sync_failed"),
+    "session_conflict_detected": get_translation("session_conflict_detected"),
+    "session_state_mismatch": get_translation("session_state_mismatch"),
+    "session_data_corrupted": get_translation("session_data_corrupted"),
+    "session_timeout_exceeded": get_translation("session_timeout_exceeded"),
+    "session_invalid_state": get_translation("session_invalid_state"),
+    "session_recovery_failed": get_translation("session_recovery_failed"),
+    "session_cleanup_failed": get_translation("session_cleanup_failed"),
+    "session_broadcast_failed": get_translation("session_broadcast_failed"),
+    "session_update_rejected": get_translation("session_update_rejected"),
+    "session_version_mismatch": get_translation("session_version_mismatch"),
+    "session_lock_timeout": get_translation("session_lock_timeout"),
+    "session_concurrent_modification": get_translation("session_concurrent_modification"),
+    "session_rollback_failed": get_translation("session_rollback_failed"),
+    "session_persistence_failed": get_translation("session_persistence_failed"),
+    
+    # Network timeout and retry error types
+    "network_timeout_short": get_translation("network_timeout_short"),
+    "network_timeout_medium": get_translation("network_timeout_medium"),
+    "network_timeout_long": get_translation("network_timeout_long"),
+    "network_retry_exhausted": get_translation("network_retry_exhausted"),
+    "network_circuit_breaker_open": get_translation("network_circuit_breaker_open"),
+    "network_quality_degraded": get_translation("network_quality_degraded"),
+    "network_quality_poor": get_translation("network_quality_poor"),
+    "network_quality_unstable": get_translation("network_quality_unstable"),
+    "network_latency_high": get_translation("network_latency_high"),
+    "network_bandwidth_limited": get_translation("network_bandwidth_limited")
+}
+
+_ERROR_DEFAULT = get_translation("error")
 
 def get_error_message(error_type, context=None):
     """
@@ -493,93 +667,9 @@ def get_error_message(error_type, context=None):
     Returns:
         str: Localized error message
     """
-    error_messages = {
-        "404": get_translation("not_found"),
-        "500": get_translation("server_error"),
-        "connection": get_translation("connection_error"),
-        "data": get_translation("data_error"),
-        "song_not_found": get_translation("song_not_found"),
-        "musician_not_found": get_translation("musician_not_found"),
-        "file_not_found": get_translation("data_file_not_found"),
-        "invalid_format": get_translation("invalid_data_format"),
-        "load_songs": get_translation("failed_to_load_songs"),
-        "load_musicians": get_translation("failed_to_load_musicians"),
-        "load_song_details": get_translation("failed_to_load_song_details"),
-        "load_musician_details": get_translation("failed_to_load_musician_details"),
-        "not_initialized": get_translation("application_not_initialized"),
-        
-        # Enhanced error types
-        "network": get_translation("network_error"),
-        "timeout": get_translation("timeout_error"),
-        "server_unavailable": get_translation("server_unavailable"),
-        "api_error": get_translation("api_error"),
-        "request_failed": get_translation("request_failed"),
-        "invalid_response": get_translation("invalid_response"),
-        "data_corruption": get_translation("data_corruption"),
-        "cache_error": get_translation("cache_error"),
-        "session_expired": get_translation("session_expired"),
-        "permission_denied": get_translation("permission_denied"),
-        "data_inconsistency": get_translation("data_inconsistency"),
-        "sync_error": get_translation("sync_error"),
-        "validation_failed": get_translation("validation_failed"),
-        "integrity_check_failed": get_translation("integrity_check_failed"),
-        "missing_required_data": get_translation("missing_required_data"),
-        "duplicate_data": get_translation("duplicate_data"),
-        
-        # WebSocket error types
-        "websocket_connection_failed": get_translation("websocket_connection_failed"),
-        "websocket_upgrade_failed": get_translation("websocket_upgrade_failed"),
-        "websocket_handshake_failed": get_translation("websocket_handshake_failed"),
-        "websocket_protocol_error": get_translation("websocket_protocol_error"),
-        "websocket_security_error": get_translation("websocket_security_error"),
-        "websocket_network_error": get_translation("websocket_network_error"),
-        "websocket_server_error": get_translation("websocket_server_error"),
-        "websocket_client_error": get_translation("websocket_client_error"),
-        "websocket_transport_error": get_translation("websocket_transport_error"),
-        "websocket_authentication_failed": get_translation("websocket_authentication_failed"),
-        "websocket_authorization_failed": get_translation("websocket_authorization_failed"),
-        "websocket_rate_limit_exceeded": get_translation("websocket_rate_limit_exceeded"),
-        "websocket_quota_exceeded": get_translation("websocket_quota_exceeded"),
-        "websocket_service_overloaded": get_translation("websocket_service_overloaded"),
-        "websocket_maintenance_mode": get_translation("websocket_maintenance_mode"),
-        
-        # Session synchronization error types
-        "session_sync_failed": get_translation("session_sync_failed"),
-        "session_conflict_detected": get_translation("session_conflict_detected"),
-        "session_state_mismatch": get_translation("session_state_mismatch"),
-        "session_data_corrupted": get_translation("session_data_corrupted"),
-        "session_timeout_exceeded": get_translation("session_timeout_exceeded"),
-        "session_invalid_state": get_translation("session_invalid_state"),
-        "session_recovery_failed": get_translation("session_recovery_failed"),
-        "session_cleanup_failed": get_translation("session_cleanup_failed"),
-        "session_broadcast_failed": get_translation("session_broadcast_failed"),
-        "session_update_rejected": get_translation("session_update_rejected"),
-        "session_version_mismatch": get_translation("session_version_mismatch"),
-        "session_lock_timeout": get_translation("session_lock_timeout"),
-        "session_concurrent_modification": get_translation("session_concurrent_modification"),
-        "session_rollback_failed": get_translation("session_rollback_failed"),
-        "session_persistence_failed": get_translation("session_persistence_failed"),
-        
-        # Network timeout and retry error types
-        "network_timeout_short": get_translation("network_timeout_short"),
-        "network_timeout_medium": get_translation("network_timeout_medium"),
-        "network_timeout_long": get_translation("network_timeout_long"),
-        "network_retry_exhausted": get_translation("network_retry_exhausted"),
-        "network_circuit_breaker_open": get_translation("network_circuit_breaker_open"),
-        "network_quality_degraded": get_translation("network_quality_degraded"),
-        "network_quality_poor": get_translation("network_quality_poor"),
-        "network_quality_unstable": get_translation("network_quality_unstable"),
-        "network_latency_high": get_translation("network_latency_high"),
-        "network_bandwidth_limited": get_translation("network_bandwidth_limited")
-    }
-    
-    message = error_messages.get(error_type, get_translation("error"))
-    
-    if context:
-        message += f": {context}"
-    
-    return message
+    return get_message("error", error_type, context)
 
+@functools.lru_cache(maxsize=64)
 def get_retry_message(attempt, max_attempts):
     """
     Get localized retry message.
@@ -596,6 +686,15 @@ def get_retry_message(attempt, max_attempts):
     else:
         return get_translation("max_retries_exceeded")
 
+# Localized recovery messages keyed by recovery type
+_RECOVERY_MESSAGES = {
+    "fallback": get_translation("fallback_mode"),
+    "degraded": get_translation("service_degraded"),
+    "recovering": get_translation("recovering")
+}
+
+_RECOVERY_DEFAULT = _RECOVERY_MESSAGES["recovering"]
+
 def get_recovery_message(recovery_type):
     """
     Get localized recovery message.
@@ -606,13 +705,7 @@ def get_recovery_message(recovery_type):
     Returns:
         str: Localized recovery message
     """
-    recovery_messages = {
-        "fallback": get_translation("fallback_mode"),
-        "degraded": get_translation("service_degraded"),
-        "recovering": get_translation("recovering")
-    }
-    
-    return recovery_messages.get(recovery_type, get_translation("recovering"))
+    return get_message("recovery", recovery_type)
 
 def format_duration_spanish(duration_str):
     """
@@ -640,6 +733,10 @@ def format_duration_spanish(duration_str):
     except (ValueError, TypeError):
         return duration_str
 
+# Order display labels
+_ORDER_LABEL = get_translation("order_label")
+_INVALID_ORDER = get_translation("invalid_order")
+
 def format_order_display(order_number):
     """
     Format order number for display in Spanish.
@@ -651,9 +748,13 @@ def format_order_display(order_number):
         str: Formatted order display in Spanish
     """
     if order_number is None or order_number < 0:
-        return get_translation("invalid_order")
+        return _INVALID_ORDER
     
-    return f"{get_translation('order_label')}: {order_number}"
+    return f"{_ORDER_LABEL}: {order_number}"
+
+# Next song messages
+_NEXT_SONG = get_translation("next_song")
+_NO_NEXT_SONG = get_translation("no_next_song")
 
 def get_next_song_message(has_next_song=True):
     """
@@ -666,9 +767,33 @@ def get_next_song_message(has_next_song=True):
         str: Next song message in Spanish
     """
     if has_next_song:
-        return get_translation("next_song")
+        return _NEXT_SONG
     else:
-        return get_translation("no_next_song")
+        return _NO_NEXT_SONG
+
+# Localized connection status messages keyed by status
+_CONNECTION_STATUS_MESSAGES = {
+    "connected": get_translation("connected"),
+    "disconnected": get_translation("disconnected"),
+    "reconnecting": get_translation("reconnecting"),
+    "websocket_connected": get_translation("websocket_connected"),
+    "websocket_disconnected": get_translation("websocket_disconnected"),
+    "websocket_error": get_translation("websocket_error"),
+    "websocket_reconnecting": get_translation("websocket_reconnecting"),
+    "connection_established": get_translation("connection_established"),
+    "connection_lost": get_translation("connection_lost"),
+    "connection_restored": get_translation("connection_restored"),
+    "connection_timeout": get_translation("connection_timeout"),
+    "connection_refused": get_translation("connection_refused"),
+    "connection_unstable": get_translation("connection_unstable"),
+    "fallback_mode": get_translation("fallback_mode_active"),
+    "polling_mode": get_translation("polling_mode"),
+    "sse_mode": get_translation("sse_mode"),
+    "real_time_disabled": get_translation("real_time_disabled"),
+    "real_time_enabled": get_translation("real_time_enabled")
+}
+
+_CONNECTION_STATUS_DEFAULT = get_translation("connection_status")
 
 def get_connection_status_message(status):
     """
@@ -680,28 +805,27 @@ def get_connection_status_message(status):
     Returns:
         str: Localized connection status message
     """
-    status_messages = {
-        "connected": get_translation("connected"),
-        "disconnected": get_translation("disconnected"),
-        "reconnecting": get_translation("reconnecting"),
-        "websocket_connected": get_translation("websocket_connected"),
-        "websocket_disconnected": get_translation("websocket_disconnected"),
-        "websocket_error": get_translation("websocket_error"),
-        "websocket_reconnecting": get_translation("websocket_reconnecting"),
-        "connection_established": get_translation("connection_established"),
-        "connection_lost": get_translation("connection_lost"),
-        "connection_restored": get_translation("connection_restored"),
-        "connection_timeout": get_translation("connection_timeout"),
-        "connection_refused": get_translation("connection_refused"),
-        "connection_unstable": get_translation("connection_unstable"),
-        "fallback_mode": get_translation("fallback_mode_active"),
-        "polling_mode": get_translation("polling_mode"),
-        "sse_mode": get_translation("sse_mode"),
-        "real_time_disabled": get_translation("real_time_disabled"),
-        "real_time_enabled": get_translation("real_time_enabled")
-    }
-    
-    return status_messages.get(status, get_translation("connection_status"))
+    return get_message("connection_status", status)
+
+# Localized global selector messages keyed by message type
+_GLOBAL_SELECTOR_MESSAGES = {
+    "title": get_translation("global_selector_title"),
+    "current_selection": get_translation("current_selection"),
+    "select_song": get_translation("select_global_song"),
+    "song_changed": get_translation("global_song_changed"),
+    "join_session": get_translation("join_global_session"),
+    "leave_session": get_translation("leave_global_session"),
+    "synchronized": get_translation("synchronized"),
+    "not_synchronized": get_translation("not_synchronized"),
+    "synchronizing": get_translation("synchronizing"),
+    "sync_complete": get_translation("sync_complete"),
+    "sync_failed": get_translation("sync_failed"),
+    "session_count": get_translation("session_count"),
+    "active_sessions": get_translation("active_sessions"),
+    "connected_users": get_translation("connected_users")
+}
+
+_GLOBAL_SELECTOR_DEFAULT = get_translation("global_selector")
 
 def get_global_selector_message(message_type, context=None):
     """
@@ -714,29 +838,25 @@ def get_global_selector_message(message_type, context=None):
     Returns:
         str: Localized global selector message
     """
-    global_messages = {
-        "title": get_translation("global_selector_title"),
-        "current_selection": get_translation("current_selection"),
-        "select_song": get_translation("select_global_song"),
-        "song_changed": get_translation("global_song_changed"),
-        "join_session": get_translation("join_global_session"),
-        "leave_session": get_translation("leave_global_session"),
-        "synchronized": get_translation("synchronized"),
-        "not_synchronized": get_translation("not_synchronized"),
-        "synchronizing": get_translation("synchronizing"),
-        "sync_complete": get_translation("sync_complete"),
-        "sync_failed": get_translation("sync_failed"),
-        "session_count": get_translation("session_count"),
-        "active_sessions": get_translation("active_sessions"),
-        "connected_users": get_translation("connected_users")
-    }
-    
-    message = global_messages.get(message_type, get_translation("global_selector"))
-    
-    if context:
-        message += f": {context}"
-    
-    return message
+    return get_message("global_selector", message_type, context)
+
+# Localized order-related error messages keyed by error type
+_ORDER_ERROR_MESSAGES = {
+    "processing": get_translation("order_processing_error"),
+    "validation": get_translation("order_validation_error"),
+    "assignment": get_translation("order_assignment_error"),
+    "calculation": get_translation("order_calculation_error"),
+    "next_song": get_translation("next_song_calculation_error"),
+    "corrupted": get_translation("order_data_corrupted"),
+    "sequence_broken": get_translation("order_sequence_broken"),
+    "synchronization": get_translation("order_synchronization_error"),
+    "invalid": get_translation("invalid_order"),
+    "missing": get_translation("missing_order"),
+    "duplicate": get_translation("duplicate_order"),
+    "conflict": get_translation("order_conflict")
+}
+
+_ORDER_ERROR_DEFAULT = _ORDER_ERROR_MESSAGES["processing"]
 
 def get_order_error_message(error_type, context=None):
     """
@@ -749,27 +869,24 @@ def get_order_error_message(error_type, context=None):
     Returns:
         str: Localized order error message
     """
-    order_error_messages = {
-        "processing": get_translation("order_processing_error"),
-        "validation": get_translation("order_validation_error"),
-        "assignment": get_translation("order_assignment_error"),
-        "calculation": get_translation("order_calculation_error"),
-        "next_song": get_translation("next_song_calculation_error"),
-        "corrupted": get_translation("order_data_corrupted"),
-        "sequence_broken": get_translation("order_sequence_broken"),
-        "synchronization": get_translation("order_synchronization_error"),
-        "invalid": get_translation("invalid_order"),
-        "missing": get_translation("missing_order"),
-        "duplicate": get_translation("duplicate_order"),
-        "conflict": get_translation("order_conflict")
-    }
-    
-    message = order_error_messages.get(error_type, get_translation("order_processing_error"))
-    
-    if context:
-        message += f": {context}"
-    
-    return message
+    return get_message("order_error", error_type, context)
+
+# Localized global functionality error messages keyed by error type
+_GLOBAL_ERROR_MESSAGES = {
+    "state": get_translation("global_state_error"),
+    "update": get_translation("global_update_error"),
+    "sync": get_translation("global_sync_error"),
+    "session": get_translation("global_session_error"),
+    "broadcast": get_translation("global_broadcast_error"),
+    "connection": get_translation("global_connection_error"),
+    "conflict": get_translation("update_conflict"),
+    "session_conflict": get_translation("session_conflict"),
+    "state_mismatch": get_translation("state_mismatch"),
+    "message_delivery": get_translation("message_delivery_failed"),
+    "invalid_session": get_translation("invalid_session")
+}
+
+_GLOBAL_ERROR_DEFAULT = _GLOBAL_ERROR_MESSAGES["state"]
 
 def get_global_error_message(error_type, context=None):
     """
@@ -782,30 +899,32 @@ def get_global_error_message(error_type, context=None):
     Returns:
         str: Localized global error message
     """
-    global_error_messages = {
-        "state": get_translation("global_state_error"),
-        "update": get_translation("global_update_error"),
-        "sync": get_translation("global_sync_error"),
-        "session": get_translation("global_session_error"),
-        "broadcast": get_translation("global_broadcast_error"),
-        "connection": get_translation("global_connection_error"),
-        "conflict": get_translation("update_conflict"),
-        "session_conflict": get_translation("session_conflict"),
-        "state_mismatch": get_translation("state_mismatch"),
-        "message_delivery": get_translation("message_delivery_failed"),
-        "invalid_session": get_translation("invalid_session")
-    }
-    
-    message = global_error_messages.get(error_type, get_translation("global_state_error"))
-    
-    if context:
-        message += f": {context}"
-    
-    return message
+    return get_message("global_error", error_type, context)
 
 # Export the main translation function for easy import
 translate = get_translation
 
+# Localized WebSocket error messages keyed by error type
+_WEBSOCKET_ERROR_MESSAGES = {
+    "connection_failed": get_translation("websocket_connection_failed"),
+    "upgrade_failed": get_translation("websocket_upgrade_failed"),
+    "handshake_failed": get_translation("websocket_handshake_failed"),
+    "protocol_error": get_translation("websocket_protocol_error"),
+    "security_error": get_translation("websocket_security_error"),
+    "network_error": get_translation("websocket_network_error"),
+    "server_error": get_translation("websocket_server_error"),
+    "client_error": get_translation("websocket_client_error"),
+    "transport_error": get_translation("websocket_transport_error"),
+    "authentication_failed": get_translation("websocket_authentication_failed"),
+    "authorization_failed": get_translation("websocket_authorization_failed"),
+    "rate_limit_exceeded": get_translation("websocket_rate_limit_exceeded"),
+    "quota_exceeded": get_translation("websocket_quota_exceeded"),
+    "service_overloaded": get_translation("websocket_service_overloaded"),
+    "maintenance_mode": get_translation("websocket_maintenance_mode")
+}
+
+_WEBSOCKET_ERROR_DEFAULT = _CONNECTION_STATUS_MESSAGES["websocket_error"]
+
 def get_websocket_error_message(error_type, context=None):
     """
     Get localized WebSocket error message.
@@ -817,30 +936,28 @@ def get_websocket_error_message(error_type, context=None):
     Returns:
         str: Localized WebSocket error message
     """
-    websocket_error_messages = {
-        "connection_failed": get_translation("websocket_connection_failed"),
-        "upgrade_failed": get_translation("websocket_upgrade_failed"),
-        "handshake_failed": get_translation("websocket_handshake_failed"),
-        "protocol_error": get_translation("websocket_protocol_error"),
-        "security_error": get_translation("websocket_security_error"),
-        "network_error": get_translation("websocket_network_error"),
-        "server_error": get_translation("websocket_server_error"),
-        "client_error": get_translation("websocket_client_error"),
-        "transport_error": get_translation("websocket_transport_error"),
-        "authentication_failed": get_translation("websocket_authentication_failed"),
-        "authorization_failed": get_translation("websocket_authorization_failed"),
-        "rate_limit_exceeded": get_translation("websocket_rate_limit_exceeded"),
-        "quota_exceeded": get_translation("websocket_quota_exceeded"),
-        "service_overloaded": get_translation("websocket_service_overloaded"),
-        "maintenance_mode": get_translation("websocket_maintenance_mode")
-    }
-    
-    message = websocket_error_messages.get(error_type, get_translation("websocket_error"))
-    
-    if context:
-        message += f": {context}"
-    
-    return message
+    return get_message("websocket_error", error_type, context)
+
+# Localized session synchronization error messages keyed by error type
+_SESSION_SYNC_ERROR_MESSAGES = {
+    "sync_failed": get_translation("session_sync_failed"),
+    "conflict_detected": get_translation("session_conflict_detected"),
+    "state_mismatch": get_translation("session_state_mismatch"),
+    "data_corrupted": get_translation("session_data_corrupted"),
+    "timeout_exceeded": get_translation("session_timeout_exceeded"),
+    "invalid_state": get_translation("session_invalid_state"),
+    "recovery_failed": get_translation("session_recovery_failed"),
+    "cleanup_failed": get_translation("session_cleanup_failed"),
+    "broadcast_failed": get_translation("session_broadcast_failed"),
+    "update_rejected": get_translation("session_update_rejected"),
+    "version_mismatch": get_translation("session_version_mismatch"),
+    "lock_timeout": get_translation("session_lock_timeout"),
+    "concurrent_modification": get_translation("session_concurrent_modification"),
+    "rollback_failed": get_translation("session_rollback_failed"),
+    "persistence_failed": get_translation("session_persistence_failed")
+}
+
+_SESSION_SYNC_ERROR_DEFAULT = _SESSION_SYNC_ERROR_MESSAGES["sync_failed"]
 
 def get_session_sync_error_message(error_type, context=None):
     """
@@ -853,30 +970,29 @@ def get_session_sync_error_message(error_type, context=None):
     Returns:
         str: Localized session sync error message
     """
-    session_sync_error_messages = {
-        "sync_failed": get_translation("session_sync_failed"),
-        "conflict_detected": get_translation("session_conflict_detected"),
-        "state_mismatch": get_translation("session_state_mismatch"),
-        "data_corrupted": get_translation("session_data_corrupted"),
-        "timeout_exceeded": get_translation("session_timeout_exceeded"),
-        "invalid_state": get_translation("session_invalid_state"),
-        "recovery_failed": get_translation("session_recovery_failed"),
-        "cleanup_failed": get_translation("session_cleanup_failed"),
-        "broadcast_failed": get_translation("session_broadcast_failed"),
-        "update_rejected": get_translation("session_update_rejected"),
-        "version_mismatch": get_translation("session_version_mismatch"),
-        "lock_timeout": get_translation("session_lock_timeout"),
-        "concurrent_modification": get_translation("session_concurrent_modification"),
-        "rollback_failed": get_translation("session_rollback_failed"),
-        "persistence_failed": get_translation("session_persistence_failed")
-    }
-    
-    message = session_sync_error_messages.get(error_type, get_translation("session_sync_failed"))
-    
-    if context:
-        message += f": {context}"
-    
-    return message
+    return get_message("session_sync_error", error_type, context)
+
+# Localized network retry messages keyed by retry type
+_NETWORK_RETRY_MESSAGES = {
+    "timeout_short": get_translation("network_timeout_short"),
+    "timeout_medium": get_translation("network_timeout_medium"),
+    "timeout_long": get_translation("network_timeout_long"),
+    "retry_exhausted": get_translation("network_retry_exhausted"),
+    "retry_in_progress": get_translation("network_retry_in_progress"),
+    "retry_scheduled": get_translation("network_retry_scheduled"),
+    "retry_cancelled": get_translation("network_retry_cancelled"),
+    "backoff_active": get_translation("network_backoff_active"),
+    "circuit_breaker_open": get_translation("network_circuit_breaker_open"),
+    "circuit_breaker_half_open": get_translation("network_circuit_breaker_half_open"),
+    "circuit_breaker_closed": get_translation("network_circuit_breaker_closed"),
+    "quality_degraded": get_translation("network_quality_degraded"),
+    "quality_poor": get_translation("network_quality_poor"),
+    "quality_unstable": get_translation("network_quality_unstable"),
+    "latency_high": get_translation("network_latency_high"),
+    "bandwidth_limited": get_translation("network_bandwidth_limited")
+}
+
+_NETWORK_RETRY_DEFAULT = _ERROR_MESSAGES["network"]
 
 def get_network_retry_message(retry_type, context=None):
     """
@@ -889,31 +1005,25 @@ def get_network_retry_message(retry_type, context=None):
     Returns:
         str: Localized network retry message
     """
-    network_retry_messages = {
-        "timeout_short": get_translation("network_timeout_short"),
-        "timeout_medium": get_translation("network_timeout_medium"),
-        "timeout_long": get_translation("network_timeout_long"),
-        "retry_exhausted": get_translation("network_retry_exhausted"),
-        "retry_in_progress": get_translation("network_retry_in_progress"),
-        "retry_scheduled": get_translation("network_retry_scheduled"),
-        "retry_cancelled": get_translation("network_retry_cancelled"),
-        "backoff_active": get_translation("network_backoff_active"),
-        "circuit_breaker_open": get_translation("network_circuit_breaker_open"),
-        "circuit_breaker_half_open": get_translation("network_circuit_breaker_half_open"),
-        "circuit_breaker_closed": get_translation("network_circuit_breaker_closed"),
-        "quality_degraded": get_translation("network_quality_degraded"),
-        "quality_poor": get_translation("network_quality_poor"),
-        "quality_unstable": get_translation("network_quality_unstable"),
-        "latency_high": get_translation("network_latency_high"),
-        "bandwidth_limited": get_translation("network_bandwidth_limited")
-    }
-    
-    message = network_retry_messages.get(retry_type, get_translation("network_error"))
-    
-    if context:
-        message += f": {context}"
-    
-    return message
+    return get_message("network_retry", retry_type, context)
+
+# Localized conflict resolution messages keyed by resolution type
+_CONFLICT_RESOLUTION_MESSAGES = {
+    "started": get_translation("conflict_resolution_started"),
+    "completed": get_translation("conflict_resolution_completed"),
+    "failed": get_translation("conflict_resolution_failed"),
+    "last_write_wins": get_translation("conflict_last_write_wins"),
+    "first_write_wins": get_translation("conflict_first_write_wins"),
+    "merge_attempted": get_translation("conflict_merge_attempted"),
+    "merge_successful": get_translation("conflict_merge_successful"),
+    "merge_failed": get_translation("conflict_merge_failed"),
+    "manual_resolution_required": get_translation("conflict_manual_resolution_required"),
+    "auto_resolution_disabled": get_translation("conflict_auto_resolution_disabled"),
+    "priority_override": get_translation("conflict_priority_override"),
+    "timestamp_comparison": get_translation("conflict_timestamp_comparison")
+}
+
+_CONFLICT_RESOLUTION_DEFAULT = get_translation("conflict_resolved")
 
 def get_conflict_resolution_message(resolution_type, context=None):
     """
@@ -926,27 +1036,26 @@ def get_conflict_resolution_message(resolution_type, context=None):
     Returns:
         str: Localized conflict resolution message
     """
-    conflict_resolution_messages = {
-        "started": get_translation("conflict_resolution_started"),
-        "completed": get_translation("conflict_resolution_completed"),
-        "failed": get_translation("conflict_resolution_failed"),
-        "last_write_wins": get_translation("conflict_last_write_wins"),
-        "first_write_wins": get_translation("conflict_first_write_wins"),
-        "merge_attempted": get_translation("conflict_merge_attempted"),
-        "merge_successful": get_translation("conflict_merge_successful"),
-        "merge_failed": get_translation("conflict_merge_failed"),
-        "manual_resolution_required": get_translation("conflict_manual_resolution_required"),
-        "auto_resolution_disabled": get_translation("conflict_auto_resolution_disabled"),
-        "priority_override": get_translation("conflict_priority_override"),
-        "timestamp_comparison": get_translation("conflict_timestamp_comparison")
-    }
-    
-    message = conflict_resolution_messages.get(resolution_type, get_translation("conflict_resolved"))
-    
-    if context:
-        message += f": {context}"
-    
-    return message
+    return get_message("conflict_resolution", resolution_type, context)
+
+# Localized recovery status messages keyed by recovery type
+_RECOVERY_STATUS_MESSAGES = {
+    "mode_activated": get_translation("recovery_mode_activated"),
+    "mode_deactivated": get_translation("recovery_mode_deactivated"),
+    "attempt_started": get_translation("recovery_attempt_started"),
+    "attempt_successful": get_translation("recovery_attempt_successful"),
+    "attempt_failed": get_translation("recovery_attempt_failed"),
+    "partial_success": get_translation("recovery_partial_success"),
+    "full_success": get_translation("recovery_full_success"),
+    "rollback_initiated": get_translation("recovery_rollback_initiated"),
+    "rollback_completed": get_translation("recovery_rollback_completed"),
+    "checkpoint_created": get_translation("recovery_checkpoint_created"),
+    "checkpoint_restored": get_translation("recovery_checkpoint_restored"),
+    "state_validated": get_translation("recovery_state_validated"),
+    "state_invalid": get_translation("recovery_state_invalid")
+}
+
+_RECOVERY_STATUS_DEFAULT = _RECOVERY_DEFAULT
 
 def get_recovery_status_message(recovery_type, context=None):
     """
@@ -959,28 +1068,23 @@ def get_recovery_status_message(recovery_type, context=None):
     Returns:
         str: Localized recovery status message
     """
-    recovery_status_messages = {
-        "mode_activated": get_translation("recovery_mode_activated"),
-        "mode_deactivated": get_translation("recovery_mode_deactivated"),
-        "attempt_started": get_translation("recovery_attempt_started"),
-        "attempt_successful": get_translation("recovery_attempt_successful"),
-        "attempt_failed": get_translation("recovery_attempt_failed"),
-        "partial_success": get_translation("recovery_partial_success"),
-        "full_success": get_translation("recovery_full_success"),
-        "rollback_initiated": get_translation("recovery_rollback_initiated"),
-        "rollback_completed": get_translation("recovery_rollback_completed"),
-        "checkpoint_created": get_translation("recovery_checkpoint_created"),
-        "checkpoint_restored": get_translation("recovery_checkpoint_restored"),
-        "state_validated": get_translation("recovery_state_validated"),
-        "state_invalid": get_translation("recovery_state_invalid")
-    }
-    
-    message = recovery_status_messages.get(recovery_type, get_translation("recovering"))
-    
-    if context:
-        message += f": {context}"
-    
-    return message
+    return get_message("recovery_status", recovery_type, context)
+
+# Localized degraded mode messages keyed by degraded type
+_DEGRADED_MODE_MESSAGES = {
+    "active": get_translation("degraded_mode_active"),
+    "inactive": get_translation("degraded_mode_inactive"),
+    "functionality_limited": get_translation("degraded_functionality_limited"),
+    "real_time_disabled": get_translation("degraded_real_time_disabled"),
+    "polling_enabled": get_translation("degraded_polling_enabled"),
+    "cache_only": get_translation("degraded_cache_only"),
+    "offline_mode": get_translation("degraded_offline_mode"),
+    "read_only": get_translation("degraded_read_only"),
+    "essential_only": get_translation("degraded_essential_only"),
+    "performance_reduced": get_translation("degraded_performance_reduced")
+}
+
+_DEGRADED_MODE_DEFAULT = _RECOVERY_MESSAGES["degraded"]
 
 def get_degraded_mode_message(degraded_type, context=None):
     """
@@ -993,25 +1097,23 @@ def get_degraded_mode_message(degraded_type, context=None):
     Returns:
         str: Localized degraded mode message
     """
-    degraded_mode_messages = {
-        "active": get_translation("degraded_mode_active"),
-        "inactive": get_translation("degraded_mode_inactive"),
-        "functionality_limited": get_translation("degraded_functionality_limited"),
-        "real_time_disabled": get_translation("degraded_real_time_disabled"),
-        "polling_enabled": get_translation("degraded_polling_enabled"),
-        "cache_only": get_translation("degraded_cache_only"),
-        "offline_mode": get_translation("degraded_offline_mode"),
-        "read_only": get_translation("degraded_read_only"),
-        "essential_only": get_translation("degraded_essential_only"),
-        "performance_reduced": get_translation("degraded_performance_reduced")
-    }
-    
-    message = degraded_mode_messages.get(degraded_type, get_translation("service_degraded"))
-    
-    if context:
-        message += f": {context}"
-    
-    return message
+    return get_message("degraded_mode", degraded_type, context)
+
+# Localized real-time notification messages keyed by notification type
+_REALTIME_NOTIFICATION_MESSAGES = {
+    "connection_lost": get_translation("realtime_connection_lost_notification"),
+    "connection_restored": get_translation("realtime_connection_restored_notification"),
+    "sync_conflict": get_translation("realtime_sync_conflict_notification"),
+    "sync_conflict_resolved": get_translation("realtime_sync_conflict_resolved_notification"),
+    "service_degraded": get_translation("realtime_service_degraded_notification"),
+    "service_restored": get_translation("realtime_service_restored_notification"),
+    "update_failed": get_translation("realtime_update_failed_notification"),
+    "update_successful": get_translation("realtime_update_successful_notification"),
+    "fallback_mode": get_translation("realtime_fallback_mode_notification"),
+    "normal_mode": get_translation("realtime_normal_mode_notification")
+}
+
+_REALTIME_NOTIFICATION_DEFAULT = _CONNECTION_STATUS_DEFAULT
 
 def get_realtime_notification_message(notification_type, context=None):
     """
@@ -1024,22 +1126,72 @@ def get_realtime_notification_message(notification_type, context=None):
     Returns:
         str: Localized real-time notification message
     """
-    realtime_notification_messages = {
-        "connection_lost": get_translation("realtime_connection_lost_notification"),
-        "connection_restored": get_translation("realtime_connection_restored_notification"),
-        "sync_conflict": get_translation("realtime_sync_conflict_notification"),
-        "sync_conflict_resolved": get_translation("realtime_sync_conflict_resolved_notification"),
-        "service_degraded": get_translation("realtime_service_degraded_notification"),
-        "service_restored": get_translation("realtime_service_restored_notification"),
-        "update_failed": get_translation("realtime_update_failed_notification"),
-        "update_successful": get_translation("realtime_update_successful_notification"),
-        "fallback_mode": get_translation("realtime_fallback_mode_notification"),
-        "normal_mode": get_translation("realtime_normal_mode_notification")
-    }
-    
-    message = realtime_notification_messages.get(notification_type, get_translation("connection_status"))
-    
-    if context:
-        message += f": {context}"
-    
-    return message
\ No newline at end of file
+    return get_message("realtime_notification", notification_type, context)
+
+# Message tables and their fallback messages, keyed by category
+_MESSAGE_CATEGORIES = {
+    "error": (_ERROR_MESSAGES, _ERROR_DEFAULT),
+    "recovery": (_RECOVERY_MESSAGES, _RECOVERY_DEFAULT),
+    "connection_status": (_CONNECTION_STATUS_MESSAGES, _CONNECTION_STATUS_DEFAULT),
+    "global_selector": (_GLOBAL_SELECTOR_MESSAGES, _GLOBAL_SELECTOR_DEFAULT),
+    "order_error": (_ORDER_ERROR_MESSAGES, _ORDER_ERROR_DEFAULT),
+    "global_error": (_GLOBAL_ERROR_MESSAGES, _GLOBAL_ERROR_DEFAULT),
+    "websocket_error": (_WEBSOCKET_ERROR_MESSAGES, _WEBSOCKET_ERROR_DEFAULT),
+    "session_sync_error": (_SESSION_SYNC_ERROR_MESSAGES, _SESSION_SYNC_ERROR_DEFAULT),
+    "network_retry": (_NETWORK_RETRY_MESSAGES, _NETWORK_RETRY_DEFAULT),
+    "conflict_resolution": (_CONFLICT_RESOLUTION_MESSAGES, _CONFLICT_RESOLUTION_DEFAULT),
+    "recovery_status": (_RECOVERY_STATUS_MESSAGES, _RECOVERY_STATUS_DEFAULT),
+    "degraded_mode": (_DEGRADED_MODE_MESSAGES, _DEGRADED_MODE_DEFAULT),
+    "realtime_notification": (_REALTIME_NOTIFICATION_MESSAGES, _REALTIME_NOTIFICATION_DEFAULT)
+}
+
+def get_message(category, key, context=None):
+    """
+    Get localized message for a key within a message category.
+    
+    Args:
+        category (str): Message category (e.g. "order_error", "websocket_error")
+        key (str): Message type within the category
+        context (str, optional): Additional context
+        
+    Returns:
+        str: Localized message, or the category fallback if key is unknown
+        
+    Raises:
+        KeyError: If category is not a known message category
+    """
+    messages, default = _MESSAGE_CATEGORIES[category]
+    message = messages[key] if key in messages else default
+    
+    if not context:
+        return message
+    
+    if not isinstance(context, str):
+        context = str(context)
+    
+    # Whitespace-only context adds nothing to the message
+    context = context.strip()
+    if not context:
+        return message
+    
+    return ": ".join((message, context))
+
+def get_messages(category, keys):
+    """
+    Get localized messages for several keys within a message category.
+    
+    Args:
+        category (str): Message category (e.g. "connection_status")
+        keys (iterable): Message types within the category
+        
+    Returns:
+        list: Localized messages in the same order as keys, using the
+        category fallback for unknown keys
+        
+    Raises:
+        KeyError: If category is not a known message category
+    """
+    messages, default = _MESSAGE_CATEGORIES[category]
+    get = messages.get
+    
+    return [get(key, default) for key in keys]
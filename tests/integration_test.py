@@ -12,11 +12,8 @@ Requirements: All requirements integration
 """
 
 import pytest
-import asyncio
-import json
+import itertools
 import time
-import threading
-from unittest.mock import Mock, patch
 import sys
 from pathlib import Path
 
@@ -24,370 +21,324 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Import application components
-from app import app, data_processor
+from app import app
 from csv_data_processor import CSVDataProcessor, OrderedSong
-from spanish_translations import get_translation, translate_instrument_name, format_order_display
+from spanish_translations import get_translation, get_message, get_messages, translate_instrument_name, format_order_display
 
 
-class IntegrationTestSuite:
-    """Comprehensive integration test suite for song order enhancement"""
+# Test song data with order information, built once at import time
+_TEST_SONGS = (
+    OrderedSong(
+        artist="Miguel Mateos",
+        song="Cuando Seas Grande",
+        lead_guitar="LUISGAL",
+        rhythm_guitar="JOHCES",
+        bass="NICMON",
+        battery="JUAROD",
+        singer="NXTPAT",
+        keyboards=None,
+        time="0:04:27",
+        song_id="miguel-mateos-cuando-seas-grande",
+        order=1
+    ),
+    OrderedSong(
+        artist="Los Prisioneros",
+        song="Por Qué No Se Van Del País",
+        lead_guitar="JOHCES",
+        rhythm_guitar="LUISGAL",
+        bass="NICMON",
+        battery="JUAROD",
+        singer="NXTPAT",
+        keyboards="MARFER",
+        time="0:03:45",
+        song_id="los-prisioneros-por-que-no-se-van-del-pais",
+        order=2
+    ),
+    OrderedSong(
+        artist="Soda Stereo",
+        song="De Música Ligera",
+        lead_guitar="LUISGAL",
+        rhythm_guitar="JOHCES",
+        bass="NICMON",
+        battery="JUAROD",
+        singer="NXTPAT",
+        keyboards=None,
+        time="0:03:52",
+        song_id="soda-stereo-de-musica-ligera",
+        order=3
+    )
+)
+
+_SONGS_BY_ID, _SONGS_BY_ORDER = {}, {}
+for _song in _TEST_SONGS:
+    _SONGS_BY_ID[_song.song_id] = _song
+    _SONGS_BY_ORDER[_song.order] = _song
+
+# (current song, expected next song, expected next order); the last song has no next
+_NEXT_SONG_CASES = [
+    ("miguel-mateos-cuando-seas-grande", "los-prisioneros-por-que-no-se-van-del-pais", 2),
+    ("los-prisioneros-por-que-no-se-van-del-pais", "soda-stereo-de-musica-ligera", 3),
+    ("soda-stereo-de-musica-ligera", None, None),
+]
+
+# (English instrument name, expected Spanish translation)
+_INSTRUMENT_TRANSLATIONS = (
+    ('Lead Guitar', 'Guitarra Principal'),
+    ('Rhythm Guitar', 'Guitarra Rítmica'),
+    ('Bass', 'Bajo'),
+    ('Battery', 'Batería'),
+    ('Singer', 'Voz'),
+    ('Keyboards', 'Teclados'),
+)
+
+
+def _is_sorted(values):
+    """Check that values are in non-decreasing order in one pass, without sorting a copy"""
+    return all(a <= b for a, b in itertools.pairwise(values))
+
+
+def _timed(func, *args):
+    """Call func(*args) and return its result with the elapsed time in seconds"""
+    start_time = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start_time
+
+
+def create_test_client():
+    """Configure the app for testing and return a Flask test client"""
+    app.config['TESTING'] = True
+    app.config['WTF_CSRF_ENABLED'] = False
     
-    def __init__(self):
-        self.app = app
-        self.test_client = None
-        self.test_data_processor = None
-        
-    def setup_test_environment(self):
-        """Set up test environment with test data"""
-        # Configure app for testing
-        self.app.config['TESTING'] = True
-        self.app.config['WTF_CSRF_ENABLED'] = False
-        
-        # Create test clients
-        self.test_client = self.app.test_client()
-        
-        # Initialize test data processor with sample data
-        self.test_data_processor = CSVDataProcessor()
-        self.setup_test_data()
-        
-        print("✓ Test environment setup complete")
-    
-    def setup_test_data(self):
-        """Create test song data with order information"""
-        test_songs = [
-            OrderedSong(
-                artist="Miguel Mateos",
-                song="Cuando Seas Grande",
-                lead_guitar="LUISGAL",
-                rhythm_guitar="JOHCES",
-                bass="NICMON",
-                battery="JUAROD",
-                singer="NXTPAT",
-                keyboards=None,
-                time="0:04:27",
-                song_id="miguel-mateos-cuando-seas-grande",
-                order=1
-            ),
-            OrderedSong(
-                artist="Los Prisioneros",
-                song="Por Qué No Se Van Del País",
-                lead_guitar="JOHCES",
-                rhythm_guitar="LUISGAL",
-                bass="NICMON",
-                battery="JUAROD",
-                singer="NXTPAT",
-                keyboards="MARFER",
-                time="0:03:45",
-                song_id="los-prisioneros-por-que-no-se-van-del-pais",
-                order=2
-            ),
-            OrderedSong(
-                artist="Soda Stereo",
-                song="De Música Ligera",
-                lead_guitar="LUISGAL",
-                rhythm_guitar="JOHCES",
-                bass="NICMON",
-                battery="JUAROD",
-                singer="NXTPAT",
-                keyboards=None,
-                time="0:03:52",
-                song_id="soda-stereo-de-musica-ligera",
-                order=3
-            )
-        ]
-        
-        # Mock the data processor's cache
-        self.test_data_processor._songs_cache = test_songs
-        self.test_data_processor._songs_by_id = {song.song_id: song for song in test_songs}
-        self.test_data_processor._songs_by_order = {song.order: song for song in test_songs}
-        self.test_data_processor._data_loaded = True
-        
-        # Build song relationships
-        self.test_data_processor._build_song_relationships()
-        
-        print("✓ Test data setup complete")
+    return app.test_client()
+
+
+def create_test_data_processor():
+    """Create a data processor preloaded with the test songs"""
+    # Mock the data processor's cache; copies keep a reload from clearing the module data
+    test_data_processor = CSVDataProcessor()
+    test_data_processor._songs_cache = list(_TEST_SONGS)
+    test_data_processor._songs_by_id = dict(_SONGS_BY_ID)
+    test_data_processor._songs_by_order = dict(_SONGS_BY_ORDER)
+    test_data_processor._data_loaded = True
     
-    def test_order_field_integration(self):
-        """Test order field integration and display (Requirements 1.1, 1.2, 1.3, 1.4)"""
-        print("\n🧪 Testing Order Field Integration...")
-        
-        # Test 1: Songs API returns songs sorted by order
-        response = self.test_client.get('/api/songs')
-        assert response.status_code == 200
-        
-        data = json.loads(response.data)
-        assert 'songs' in data
-        songs = data['songs']
-        
+    # Build song relationships
+    test_data_processor._build_song_relationships()
+    
+    return test_data_processor
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Flask test client shared by every test in the session"""
+    return create_test_client()
+
+
+@pytest.fixture(scope="session")
+def test_data_processor():
+    """Data processor with the three-song test catalog"""
+    return create_test_data_processor()
+
+
+@pytest.fixture(scope="session")
+def first_song_response(client):
+    """Details response for the first song, fetched once per session"""
+    return client.get('/api/song/miguel-mateos-cuando-seas-grande')
+
+
+def test_order_field_integration(client, first_song_response):
+    """Test order field integration and display (Requirements 1.1, 1.2, 1.3, 1.4)"""
+    # Test 1: Songs API returns songs sorted by order
+    response = client.get('/api/songs')
+    assert response.status_code == 200
+    
+    data = response.get_json()
+    assert 'songs' in data
+    songs = data['songs']
+    
+    # Verify songs are sorted by order
+    orders = [song.get('order', 9999) for song in songs]
+    assert _is_sorted(orders), "Songs should be sorted by order"
+    
+    # Test 2: Song details include order information
+    response = first_song_response
+    assert response.status_code == 200
+    
+    song_data = response.get_json()
+    assert 'order' in song_data
+    assert song_data['order'] == 1
+    
+    # Test 3: Musician details show songs sorted by order with Spanish formatting
+    response = client.get('/api/musician/LUISGAL')
+    assert response.status_code == 200
+    
+    musician_data = response.get_json()
+    if 'songs' in musician_data:
         # Verify songs are sorted by order
-        orders = [song.get('order', 9999) for song in songs]
-        assert orders == sorted(orders), "Songs should be sorted by order"
-        
-        # Test 2: Song details include order information
-        response = self.test_client.get('/api/song/miguel-mateos-cuando-seas-grande')
-        assert response.status_code == 200
-        
-        song_data = json.loads(response.data)
-        assert 'order' in song_data
-        assert song_data['order'] == 1
-        
-        # Test 3: Musician details show songs sorted by order with Spanish formatting
-        response = self.test_client.get('/api/musician/LUISGAL')
-        assert response.status_code == 200
-        
-        musician_data = json.loads(response.data)
-        if 'songs' in musician_data:
-            # Verify songs are sorted by order
-            song_orders = [song.get('order', 9999) for song in musician_data['songs']]
-            assert song_orders == sorted(song_orders), "Musician songs should be sorted by order"
-            
-            # Verify Spanish order formatting
-            for song in musician_data['songs']:
-                if 'order_display' in song:
-                    assert 'Orden:' in song['order_display'], "Order should be displayed in Spanish"
-        
-        print("✓ Order field integration tests passed")
+        song_orders = [song.get('order', 9999) for song in musician_data['songs']]
+        assert _is_sorted(song_orders), "Musician songs should be sorted by order"
     
-    def test_next_song_calculation(self):
-        """Test next song calculation and navigation (Requirements 2.1, 2.2, 2.4, 2.5)"""
-        print("\n🧪 Testing Next Song Calculation...")
-        
-        # Test 1: Next song calculation for first song
-        next_song = self.test_data_processor.get_next_song("miguel-mateos-cuando-seas-grande")
-        assert next_song is not None
-        assert next_song.song_id == "los-prisioneros-por-que-no-se-van-del-pais"
-        assert next_song.order == 2
-        
-        # Test 2: Next song calculation for middle song
-        next_song = self.test_data_processor.get_next_song("los-prisioneros-por-que-no-se-van-del-pais")
-        assert next_song is not None
-        assert next_song.song_id == "soda-stereo-de-musica-ligera"
-        assert next_song.order == 3
-        
-        # Test 3: Next song calculation for last song (should be None)
-        next_song = self.test_data_processor.get_next_song("soda-stereo-de-musica-ligera")
+        # Verify Spanish order formatting
+        for song in musician_data['songs']:
+            if 'order_display' in song:
+                assert 'Orden:' in song['order_display'], "Order should be displayed in Spanish"
+
+
+@pytest.mark.parametrize("current_song_id,next_song_id,next_order", _NEXT_SONG_CASES)
+def test_next_song(test_data_processor, current_song_id, next_song_id, next_order):
+    """Test next song calculation for the first, middle and last song (Requirements 2.1, 2.2)"""
+    next_song = test_data_processor.get_next_song(current_song_id)
+    if next_song_id is None:
         assert next_song is None
-        
-        # Test 4: Next song info formatting
-        next_song_info = self.test_data_processor.get_next_song_info("miguel-mateos-cuando-seas-grande")
-        assert next_song_info is not None
-        assert 'song_id' in next_song_info
-        assert 'title' in next_song_info
-        assert 'order' in next_song_info
-        assert next_song_info['order'] == 2
-        
-        # Test 5: Song details API includes next song information
-        response = self.test_client.get('/api/song/miguel-mateos-cuando-seas-grande')
-        assert response.status_code == 200
-        
-        song_data = json.loads(response.data)
-        assert 'next_song' in song_data
-        if song_data['next_song']:
-            assert song_data['next_song']['order'] == 2
-        
-        print("✓ Next song calculation tests passed")
+    else:
+        assert next_song is not None
+        assert next_song.song_id == next_song_id
+        assert next_song.order == next_order
+
+
+def test_next_song_calculation(test_data_processor, first_song_response):
+    """Test next song info and navigation (Requirements 2.4, 2.5)"""
+    # Test 1: Next song info formatting
+    next_song_info = test_data_processor.get_next_song_info("miguel-mateos-cuando-seas-grande")
+    assert next_song_info is not None
+    assert 'song_id' in next_song_info
+    assert 'title' in next_song_info
+    assert 'order' in next_song_info
+    assert next_song_info['order'] == 2
     
-    def test_spanish_language_integration(self):
-        """Test Spanish language support throughout the application (Requirements 5.1-5.5)"""
-        print("\n🧪 Testing Spanish Language Integration...")
-        
-        # Test 1: Spanish translations are available
-        assert get_translation('order_label') == 'Orden'
-        assert get_translation('next_song') == 'Siguiente canción'
-        assert get_translation('global_selector_title') == 'Selector Global de Canciones'
-        
-        # Test 2: Instrument name translation
-        assert translate_instrument_name('Lead Guitar') == 'Guitarra Principal'
-        assert translate_instrument_name('Rhythm Guitar') == 'Guitarra Rítmica'
-        assert translate_instrument_name('Bass') == 'Bajo'
-        assert translate_instrument_name('Battery') == 'Batería'
-        assert translate_instrument_name('Singer') == 'Voz'
-        assert translate_instrument_name('Keyboards') == 'Teclados'
-        
-        # Test 3: Order display formatting in Spanish
-        order_display = format_order_display(1)
-        assert order_display == 'Orden: 1'
-        
-        # Test 4: Song details API returns Spanish instrument names
-        response = self.test_client.get('/api/song/miguel-mateos-cuando-seas-grande')
-        assert response.status_code == 200
-        
-        song_data = json.loads(response.data)
-        if 'assignments' in song_data:
-            spanish_instruments = list(song_data['assignments'].keys())
-            assert 'Guitarra Principal' in spanish_instruments or 'Lead Guitar' in spanish_instruments
-        
-        # Test 5: Main page renders with Spanish translations
-        response = self.test_client.get('/')
-        assert response.status_code == 200
-        html_content = response.data.decode('utf-8')
-        assert 'Selector de Canciones' in html_content or 'translations' in html_content
-        
-        # Test 6: Global selector page renders with Spanish translations
-        response = self.test_client.get('/global-selector')
-        assert response.status_code == 200
-        html_content = response.data.decode('utf-8')
-        assert 'Selector Global' in html_content or 'translations' in html_content
-        
-        print("✓ Spanish language integration tests passed")
+    # Test 2: Song details API includes next song information
+    response = first_song_response
+    assert response.status_code == 200
     
-    def test_error_handling_resilience(self):
-        """Test error handling and system resilience (Requirements 8.4, 8.5)"""
-        print("\n🧪 Testing Error Handling and Resilience...")
-        
-        # Test 1: Invalid song ID handling
-        response = self.test_client.get('/api/song/invalid-song-id')
-        assert response.status_code == 404
-        
-        error_data = json.loads(response.data)
-        assert 'error' in error_data
-        
-        # Test 2: Invalid musician ID handling
-        response = self.test_client.get('/api/musician/INVALID')
-        assert response.status_code == 404
-        
-        error_data = json.loads(response.data)
-        assert 'error' in error_data
-        
-        # Test 3: Data consistency validation
-        if hasattr(self.test_data_processor, 'validate_data_consistency'):
-            consistency_result = self.test_data_processor.validate_data_consistency()
-            assert isinstance(consistency_result, dict)
-        
-        print("✓ Error handling and resilience tests passed")
+    song_data = response.get_json()
+    assert 'next_song' in song_data
+    if song_data['next_song']:
+        assert song_data['next_song']['order'] == 2
+
+
+def test_spanish_language_integration(client, first_song_response):
+    """Test Spanish language support throughout the application (Requirements 5.1-5.5)"""
+    # Test 1: Spanish translations are available
+    assert get_translation('order_label') == 'Orden'
+    assert get_translation('next_song') == 'Siguiente canción'
+    assert get_translation('global_selector_title') == 'Selector Global de Canciones'
     
-    def test_performance_requirements(self):
-        """Test performance requirements (Requirements 8.1, 8.2, 8.3)"""
-        print("\n🧪 Testing Performance Requirements...")
-        
-        # Test 1: Song loading performance (should complete within 3 seconds)
-        start_time = time.time()
-        response = self.test_client.get('/api/songs')
-        end_time = time.time()
-        
-        assert response.status_code == 200
-        load_time = end_time - start_time
-        assert load_time < 3.0, f"Song loading took {load_time:.2f}s, should be < 3s"
-        
-        # Test 2: Song details loading performance (should complete within 1 second)
-        start_time = time.time()
-        response = self.test_client.get('/api/song/miguel-mateos-cuando-seas-grande')
-        end_time = time.time()
-        
-        assert response.status_code == 200
-        detail_time = end_time - start_time
-        assert detail_time < 1.0, f"Song details loading took {detail_time:.2f}s, should be < 1s"
-        
-        # Test 3: Next song calculation performance (should complete within 1 second)
-        start_time = time.time()
-        next_song = self.test_data_processor.get_next_song("miguel-mateos-cuando-seas-grande")
-        end_time = time.time()
-        
-        calc_time = end_time - start_time
-        assert calc_time < 1.0, f"Next song calculation took {calc_time:.2f}s, should be < 1s"
-        
-        print("✓ Performance requirements tests passed")
+    # Test 2: Instrument name translation
+    for english_name, spanish_name in _INSTRUMENT_TRANSLATIONS:
+        assert translate_instrument_name(english_name) == spanish_name
     
-    def test_complete_user_workflows(self):
-        """Test complete user workflows with order functionality"""
-        print("\n🧪 Testing Complete User Workflows...")
-        
-        # Workflow 1: Song selection with order navigation
-        print("  Testing song selection workflow...")
-        
-        # Step 1: Load songs list
-        response = self.test_client.get('/api/songs')
-        assert response.status_code == 200
-        songs_data = json.loads(response.data)
-        
-        # Step 2: Select first song
-        first_song_id = "miguel-mateos-cuando-seas-grande"
-        response = self.test_client.get(f'/api/song/{first_song_id}')
-        assert response.status_code == 200
-        song_data = json.loads(response.data)
-        
-        # Step 3: Verify next song information is included
-        assert 'next_song' in song_data
-        if song_data['next_song']:
-            next_song_id = song_data['next_song']['song_id']
-            
-            # Step 4: Navigate to next song
-            response = self.test_client.get(f'/api/song/{next_song_id}')
-            assert response.status_code == 200
-            next_song_data = json.loads(response.data)
-            assert next_song_data['order'] > song_data['order']
-        
-        # Workflow 2: Musician assignment workflow
-        print("  Testing musician assignment workflow...")
-        
-        # Step 1: Get musician list
-        response = self.test_client.get('/api/musicians')
-        assert response.status_code == 200
-        musicians_data = json.loads(response.data)
-        
-        if musicians_data.get('musicians'):
-            # Step 2: Select first musician
-            first_musician = musicians_data['musicians'][0]['id']
-            response = self.test_client.get(f'/api/musician/{first_musician}')
-            assert response.status_code == 200
-            musician_data = json.loads(response.data)
-            
-            # Step 3: Verify songs are sorted by order
-            if musician_data.get('songs'):
-                orders = [song.get('order', 9999) for song in musician_data['songs']]
-                assert orders == sorted(orders), "Musician songs should be sorted by order"
-        
-        print("✓ Complete user workflows tests passed")
+    # Test 3: Order display formatting in Spanish
+    order_display = format_order_display(1)
+    assert order_display == 'Orden: 1'
     
-    def run_all_tests(self):
-        """Run all integration tests"""
-        print("🚀 Starting Comprehensive Integration Tests for Song Order Enhancement")
-        print("=" * 80)
-        
-        try:
-            # Setup
-            self.setup_test_environment()
-            
-            # Run all test suites
-            self.test_order_field_integration()
-            self.test_next_song_calculation()
-            self.test_spanish_language_integration()
-            self.test_error_handling_resilience()
-            self.test_performance_requirements()
-            self.test_complete_user_workflows()
-            
-            print("\n" + "=" * 80)
-            print("🎉 ALL INTEGRATION TESTS PASSED!")
-            print("✅ Order processing and Spanish UI are fully integrated")
-            print("✅ Next song navigation and display working correctly")
-            print("✅ Spanish language support integrated throughout")
-            print("✅ Error handling and resilience mechanisms working")
-            print("✅ Performance requirements met")
-            print("✅ Complete user workflows functioning properly")
-            
-            return True
-            
-        except Exception as e:
-            print(f"\n❌ Integration test failed: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return False
-
-
-def main():
-    """Main function to run integration tests"""
-    test_suite = IntegrationTestSuite()
-    success = test_suite.run_all_tests()
-    
-    if success:
-        print("\n🎯 Integration test completed successfully!")
-        print("The song order enhancement is fully integrated and working.")
-        exit(0)
-    else:
-        print("\n💥 Integration test failed!")
-        print("Please check the error messages above and fix any issues.")
-        exit(1)
+    # Test 3b: Category message dispatch with context
+    assert get_message('order_error', 'invalid') == 'Orden inválido'
+    assert get_message('order_error', 'unknown') == 'Error al procesar orden'
+    assert get_message('error', '404', 'canción') == 'No encontrado: canción'
+    assert get_message('error', '404', '   ') == 'No encontrado'
+    assert get_messages('connection_status', ['connected', 'unknown']) == ['Conectado', 'Estado de conexión']
+    
+    # Test 4: Song details API returns Spanish instrument names
+    response = first_song_response
+    assert response.status_code == 200
+    
+    song_data = response.get_json()
+    if 'assignments' in song_data:
+        spanish_instruments = list(song_data['assignments'].keys())
+        assert 'Guitarra Principal' in spanish_instruments or 'Lead Guitar' in spanish_instruments
+    
+    # Test 5: Main page renders with Spanish translations
+    response = client.get('/')
+    assert response.status_code == 200
+    html_content = response.data.decode('utf-8')
+    assert 'Selector de Canciones' in html_content or 'translations' in html_content
+    
+    # Test 6: Global selector page renders with Spanish translations
+    response = client.get('/global-selector')
+    assert response.status_code == 200
+    html_content = response.data.decode('utf-8')
+    assert 'Selector Global' in html_content or 'translations' in html_content
+
+
+def test_error_handling_resilience(client, test_data_processor):
+    """Test error handling and system resilience (Requirements 8.4, 8.5)"""
+    # Test 1: Invalid song ID handling
+    response = client.get('/api/song/invalid-song-id')
+    assert response.status_code == 404
+    
+    error_data = response.get_json()
+    assert 'error' in error_data
+    
+    # Test 2: Invalid musician ID handling
+    response = client.get('/api/musician/INVALID')
+    assert response.status_code == 404
+    
+    error_data = response.get_json()
+    assert 'error' in error_data
+    
+    # Test 3: Data consistency validation
+    if hasattr(test_data_processor, 'validate_data_consistency'):
+        consistency_result = test_data_processor.validate_data_consistency()
+        assert isinstance(consistency_result, dict)
 
 
-if __name__ == '__main__':
-    main()
\ No newline at end of file
+def test_performance_requirements(client, test_data_processor):
+    """Test performance requirements (Requirements 8.1, 8.2, 8.3)"""
+    # Test 1: Song loading performance (should complete within 3 seconds)
+    response, load_time = _timed(client.get, '/api/songs')
+    
+    assert response.status_code == 200
+    assert load_time < 3.0, f"Song loading took {load_time:.2f}s, should be < 3s"
+    
+    # Test 2: Song details loading performance (should complete within 1 second)
+    response, detail_time = _timed(client.get, '/api/song/miguel-mateos-cuando-seas-grande')
+    
+    assert response.status_code == 200
+    assert detail_time < 1.0, f"Song details loading took {detail_time:.2f}s, should be < 1s"
+    
+    # Test 3: Next song calculation performance (should complete within 1 second)
+    next_song, calc_time = _timed(test_data_processor.get_next_song, "miguel-mateos-cuando-seas-grande")
+    
+    assert calc_time < 1.0, f"Next song calculation took {calc_time:.2f}s, should be < 1s"
+
+
+def test_complete_user_workflows(client, first_song_response):
+    """Test complete user workflows with order functionality"""
+    # Workflow 1: Song selection with order navigation
+    # Step 1: Load songs list
+    response = client.get('/api/songs')
+    assert response.status_code == 200
+    songs_data = response.get_json()
+    
+    # Step 2: Select first song
+    response = first_song_response
+    assert response.status_code == 200
+    song_data = response.get_json()
+    
+    # Step 3: Verify next song information is included
+    assert 'next_song' in song_data
+    if song_data['next_song']:
+        next_song_id = song_data['next_song']['song_id']
+    
+        # Step 4: Navigate to next song
+        response = client.get(f'/api/song/{next_song_id}')
+        assert response.status_code == 200
+        next_song_data = response.get_json()
+        assert next_song_data['order'] > song_data['order']
+    
+    # Workflow 2: Musician assignment workflow
+    # Step 1: Get musician list
+    response = client.get('/api/musicians')
+    assert response.status_code == 200
+    musicians_data = response.get_json()
+    
+    # Step 2: Select first musician, if any
+    first_musician = next(iter(musicians_data.get('musicians') or ()), None)
+    if first_musician is not None:
+        response = client.get(f"/api/musician/{first_musician['id']}")
+        assert response.status_code == 200
+        musician_data = response.get_json()
+        
+        # Step 3: Verify songs are sorted by order
+        if musician_data.get('songs'):
+            orders = [song.get('order', 9999) for song in musician_data['songs']]
+            assert _is_sorted(orders), "Musician songs should be sorted by order"